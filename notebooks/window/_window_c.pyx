@@ -0,0 +1,58 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -march=native -ffast-math
+"""
+A C implementation of the cosine-sum window kernel in window_numba.py.
+
+Run `cythonize -i _window_c.pyx` to build the _window_c extension module next
+to this file. window.py prefers it over the Numba kernel for the float64
+cosine-sum windows because calling it costs a single C call.
+"""
+from libc.math cimport cos, M_PI
+
+
+cdef inline double _cosine_sum(double phase, Py_ssize_t i, const double* a) noexcept nogil:
+    """Return the cosine sum with coefficients a at sample i."""
+    # cos(k phi) follows from the Chebyshev recurrence on cos(phi)
+    cdef double c1 = cos(phase * i)
+    cdef double c2 = 2 * c1 * c1 - 1
+    cdef double c3 = 2 * c1 * c2 - c1
+    cdef double c4 = 2 * c1 * c3 - c2
+    return a[0] - a[1] * c1 + a[2] * c2 - a[3] * c3 + a[4] * c4
+
+
+def cosine_sum(double M, const double[::1] coeffs, double[:] out):
+    """
+    Compute a generalized float64 cosine-sum window of up to five terms.
+
+    NumPy's vectorized single precision cos is faster than this scalar loop
+    for float32 windows, so only float64 outputs are supported.
+
+    Args:
+        M: the denominator of the phase 2 pi n / M
+        coeffs: the magnitudes of the terms (a_0, a_1, ..., a_K) where the
+        sign of each term alternates starting from a positive a_0
+        out: the array to write the window into
+
+    Returns:
+        None
+
+    """
+    if coeffs.shape[0] > 5:
+        raise ValueError('at most 5 coefficients are supported')
+    # unused terms have a coefficient of zero
+    cdef double a[5]
+    cdef Py_ssize_t i, N = out.shape[0]
+    for i in range(5):
+        a[i] = coeffs[i] if i < coeffs.shape[0] else 0.0
+    if N == 0:
+        return
+    cdef double phase = 2 * M_PI / M
+    cdef double* data
+    with nogil:
+        if out.strides[0] == sizeof(double):
+            data = &out[0]
+            for i in range(N):
+                data[i] = _cosine_sum(phase, i, a)
+        else:
+            for i in range(N):
+                out[i] = _cosine_sum(phase, i, a)
@@ -1,21 +1,34 @@
 """A method to plot and return comparisons of the given windowing functions."""
+import numpy as np
 import matplotlib.pyplot as plt
 
 
-def compare(N, windowTest, windowReference, sym=False):
+def compare(N, windowTest, windowReference, sym=False, test=None, reference=None):
     """
     Plot and return comparisons of the given windowing functions.
-    
+
     Args:
         N: the length of the window
         windowTest: the test window function
         windowReference: the reference window function
+        sym: whether to compare symmetric or periodic windows
+        test: the precomputed test window, or None to compute it
+        reference: the precomputed reference window, or None to compute it
+
+    Returns:
+        a tuple of the test window and the reference window
+
     """
-    sample_idx = list(range(N))
-    test = windowTest(N, sym=sym)
-    plt.plot(sample_idx, test)
-    reference = windowReference(N, sym=sym)
-    plt.plot(sample_idx, reference)
+    if test is None:
+        test = windowTest(N, sym=sym)
+    if reference is None:
+        # the same function produces the same window, don't compute it twice
+        if windowReference is windowTest:
+            reference = test
+        else:
+            reference = windowReference(N, sym=sym)
+    sample_idx = np.arange(N)
+    plt.plot(sample_idx, test, sample_idx, reference)
     plt.legend(['Test', 'Reference'])
     plt.xlabel('$n$')
     plt.ylabel('w[n]')
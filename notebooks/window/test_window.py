@@ -0,0 +1,32 @@
+"""Checks of the window functions in window.py, run with `pytest`."""
+import numpy as np
+import window
+
+
+def test_cosine_sum_batch_matches_windows():
+    Ns = [1, 2, 7, 8]
+    windows = (
+        ((0.50, 0.50), window.hann),
+        ((0.42, 0.50, 0.08), window.blackman),
+    )
+    for coeffs, single in windows:
+        for sym in (False, True):
+            for dtype in (np.float32, np.float64):
+                batch = window.cosine_sum_batch(Ns, coeffs, sym, dtype)
+                assert batch.shape == (len(Ns), max(Ns))
+                assert batch.dtype == dtype
+                for i, N in enumerate(Ns):
+                    expected = single(N, sym=sym, dtype=dtype)
+                    assert np.allclose(batch[i, :N], expected, atol=1e-6)
+                    assert not batch[i, N:].any()
+
+
+def test_cosine_sum_batch_scalar():
+    batch = window.cosine_sum_batch(8, (0.50, 0.50))
+    assert batch.shape == (1, 8)
+    assert np.allclose(batch[0], window.hann(8, sym=False))
+
+
+def test_cosine_sum_batch_empty():
+    assert window.cosine_sum_batch([0, 0], (0.50, 0.50)).shape == (2, 0)
+    assert window.cosine_sum_batch([], (0.50, 0.50)).shape == (0, 0)
@@ -1,31 +1,291 @@
 """Window functions."""
+from functools import lru_cache, wraps
+import inspect
 import numpy as np
 
 
+# Multiples of pi precomputed once. These are Python floats because NumPy
+# scalars would promote float32 windows to float64.
+_PI = np.pi
+_2PI = 2 * np.pi
+_INV_PI = 1 / np.pi
+
+
+@lru_cache(maxsize=None)
+def _load_kernels():
+    """
+    Return the compiled window kernels keyed by their name and output dtype.
+
+    The ahead-of-time build of the kernels (see window_aot.py) is preferred,
+    then the Numba JIT kernels. The C cosine-sum kernel (see _window_c.pyx)
+    takes precedence over both when it is built. Without any of them, no
+    kernels are returned and the NumPy implementations are used. The kernels
+    are loaded on the first call, so importing this module neither imports
+    Numba nor compiles anything.
+
+    Returns:
+        a dictionary mapping (name, dtype) to the kernel that writes the named
+        window into an output array of that dtype
+
+    """
+    kernels = {}
+    try:
+        import window_native
+    except ImportError:
+        try:  # Numba is optional, the NumPy implementations are used without it
+            import window_numba
+        except ImportError:
+            pass
+        else:
+            for name in window_numba.__all__:
+                for dtype in window_numba.SIGNATURES[name]:
+                    kernels[name, np.dtype(dtype)] = getattr(window_numba, name)
+    else:  # exports are suffixed by the output dtype, e.g., tukey_float32
+        for export in dir(window_native):
+            name, _, dtype = export.rpartition('_')
+            if dtype in ('float32', 'float64'):
+                kernels[name, np.dtype(dtype)] = getattr(window_native, export)
+    try:
+        import _window_c
+    except ImportError:
+        pass
+    else:  # a single C call has the least overhead for the cosine-sum windows
+        kernels['cosine_sum', np.dtype(np.float64)] = _window_c.cosine_sum
+    return kernels
+
+
+def _kernel(name, w):
+    """
+    Return the compiled kernel with the given name that writes into w.
+
+    Args:
+        name: the name of the kernel, see window_numba.py
+        w: the output array, the dtype of which selects the kernel
+
+    Returns:
+        the kernel, or None to use the NumPy implementation
+
+    """
+    return _load_kernels().get((name, w.dtype))
+
+
+def _denom(N, sym):
+    """
+    Return the denominator that normalizes the sample indexes of a window.
+
+    Args:
+        N: Number of points in the window.
+        sym: whether the window is symmetric or periodic
+
+    Returns:
+        N - 1 for a symmetric window and N for a periodic window
+
+    """
+    return N - 1 if sym else N
+
+
+@lru_cache(maxsize=32)
+def _ramp(N, dtype=np.float64):
+    """
+    Return the read-only sample indexes [0, N) as floating point values.
+
+    Args:
+        N: Number of points in the ramp.
+        If zero or less, an empty array is returned.
+        dtype: the floating point type of the ramp
+
+    Returns:
+        the cached ramp of length N, which must not be written to
+
+    """
+    n = np.arange(N, dtype=dtype)
+    n.flags.writeable = False
+    return n
+
+
+def _output(N, out, dtype):
+    """
+    Return the buffer to compute a window of length N in.
+
+    Args:
+        N: Number of points in the output window.
+        out: the array provided by the caller, or None to allocate one
+        dtype: the floating point type to allocate the array with
+
+    Returns:
+        out if it is provided, otherwise a new uninitialized array
+
+    Raises:
+        ValueError: if out is provided and its shape is not (N,)
+
+    """
+    shape = (max(N, 0),)
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError('out has shape %s, expected %s' % (out.shape, shape))
+    return out
+
+
+def _cached_window(window):
+    """
+    Cache the results of a window function by its arguments.
+
+    Cached windows are read-only, callers that need to modify a window should
+    copy it first. Calls that provide an out buffer bypass the cache.
+
+    A symmetric window of length 1 has a denominator of zero. It is returned
+    as [1] here, before the window function or any kernel divides by zero, so
+    that every backend produces the same result.
+
+    Args:
+        window: the window function to cache
+
+    Returns:
+        the window function wrapped with a cache of read-only results
+
+    """
+    parameters = inspect.signature(window).parameters
+    index = {name: i for i, name in enumerate(parameters)}
+    default = {name: p.default for name, p in parameters.items()}
+
+    def argument(name, args, kwargs):
+        # look up a single argument, binding all of them costs microseconds
+        i = index[name]
+        return args[i] if len(args) > i else kwargs.get(name, default[name])
+
+    def compute(*args, **kwargs):
+        N = argument('N', args, kwargs)
+        if _denom(N, argument('sym', args, kwargs)) != 0:
+            return window(*args, **kwargs)
+        out, dtype = argument('out', args, kwargs), argument('dtype', args, kwargs)
+        w = _output(N, out, dtype)
+        w.fill(1.0)
+        return w
+
+    # The cache is keyed on the arguments as given, so a hit is a single
+    # lookup. Equivalent calls spelled differently, e.g., hann(8) and
+    # hann(8, sym=True), are separate entries.
+    @lru_cache(maxsize=64)
+    def cached(*args, **kwargs):
+        w = compute(*args, **kwargs)
+        w.flags.writeable = False
+        return w
+
+    @wraps(window)
+    def wrapper(*args, **kwargs):
+        if argument('out', args, kwargs) is not None:
+            return compute(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _cosine_series(x, coeffs, w):
+    """
+    Evaluate a cosine series at the given phases in place.
+
+    Args:
+        x: the phases n / N in cycles, which are overwritten
+        coeffs: the magnitudes of the terms (a_0, a_1, ..., a_K) where the
+        sign of each term alternates starting from a positive a_0
+        w: the array to write the series into, with the same shape as x
+
+    Returns:
+        w after writing sum_k (-1)^k a_k cos(2 pi k x) into it
+
+    """
+    w.fill(coeffs[0])
+    if len(coeffs) == 1:
+        return w
+    # Compute 2 cos(phi) in place of the phases. Each harmonic is then derived
+    # using the Chebyshev recurrence
+    # cos(k phi) = 2 cos(phi) cos((k - 1) phi) - cos((k - 2) phi)
+    # so that only a single call to np.cos is made for the entire sum.
+    two_cos = np.multiply(x, _2PI, out=x)
+    np.cos(two_cos, out=two_cos)
+    np.multiply(two_cos, 2, out=two_cos)
+    previous = np.ones(w.shape, dtype=w.dtype)
+    current = 0.5 * two_cos
+    temp = np.empty(w.shape, dtype=w.dtype)
+    for k, a_k in enumerate(coeffs[1:], start=1):
+        np.multiply(current, -a_k if k % 2 else a_k, out=temp)
+        np.add(w, temp, out=w)
+        if k == len(coeffs) - 1:
+            break
+        np.multiply(two_cos, current, out=temp)
+        np.subtract(temp, previous, out=previous)
+        previous, current = current, previous
+    return w
+
+
+def _cosine_sum(N, sym, coeffs, out=None, dtype=np.float32):
+    """
+    Return a generalized cosine-sum window.
+
+    Args:
+        N: Number of points in the output window.
+        sym: whether to generate a symmetric or periodic window
+        coeffs: the magnitudes of the terms (a_0, a_1, ..., a_K) where the
+        sign of each term alternates starting from a positive a_0
+        out: optional array of length N to write the window into
+        dtype: the floating point type of the window when allocating it
+
+    Returns:
+        the window sum_k (-1)^k a_k cos(2 pi k n / N) of length N
+
+    """
+    w = _output(N, out, dtype)
+    kernel = _kernel('cosine_sum', w)
+    if kernel is not None and len(coeffs) <= 5:
+        # the kernels evaluate exactly five terms, unused terms are zero
+        padded = np.zeros(5)
+        padded[:len(coeffs)] = coeffs
+        kernel(_denom(N, sym), padded, w)
+        return w
+    x = np.divide(_ramp(N, w.dtype), _denom(N, sym))
+    return _cosine_series(x, coeffs, w)
+
+
 # ----------------------------------------------------------------------------
 # MARK: Non-Parametric Windows
 # ----------------------------------------------------------------------------
 
 
-def boxcar(N, sym=True):
+@_cached_window
+def boxcar(N, sym=True, out=None, dtype=np.float32):
     """
     Return a Boxcar window.
 
+    Applying a Boxcar window leaves a signal unchanged. Without out, the window
+    is a single one broadcast to length N, which apply_window recognizes and
+    skips like BOXCAR. Passing BOXCAR also skips allocating the window.
+
     Args:
         N: Number of points in the output window. 
         If zero or less, an empty array is returned.
-        sym: When True (default), generates a symmetric window, 
-        for use in filter design. When False, generates a 
-        periodic window, for use in spectral analysis.
+        sym: Ignored, the symmetric and periodic Boxcar windows are the
+        same. Accepted for consistency with the other windows.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Boxcar window of length N with given symmetry
 
     """
-    return np.ones(N)
+    if out is None:
+        return np.broadcast_to(np.ones(1, dtype=dtype), max(N, 0))
+    w = _output(N, out, dtype)
+    w.fill(1.0)
+    return w
 
 
-def bartlett(N, sym=False):
+@_cached_window
+def bartlett(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Bartlett window.
 
@@ -35,17 +295,30 @@ def bartlett(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Bartlett window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return (2.0 / N) * ((N / 2) - abs(n - N / 2))
+    M = _denom(N, sym)
+    w = _output(N, out, dtype)
+    kernel = _kernel('bartlett', w)
+    if kernel is not None:
+        kernel(M, w)
+        return w
+    np.divide(_ramp(N, w.dtype), M / 2, out=w)
+    np.subtract(w, 1.0, out=w)
+    np.abs(w, out=w)
+    np.subtract(1.0, w, out=w)
+    return w
 
 
-def barthann(N, sym=False):
+@_cached_window
+def barthann(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Bartlett-Hann window.
 
@@ -55,17 +328,35 @@ def barthann(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Bartlett-Hann window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return 0.62 - 0.48 * abs(n / N - 0.5) - 0.38 * np.cos(2 * np.pi * n / N)
+    M = _denom(N, sym)
+    w = _output(N, out, dtype)
+    kernel = _kernel('barthann', w)
+    if kernel is not None:
+        kernel(M, w)
+        return w
+    np.divide(_ramp(N, w.dtype), M, out=w)
+    c = np.multiply(w, _2PI)
+    np.cos(c, out=c)
+    np.multiply(c, 0.38, out=c)
+    np.subtract(w, 0.5, out=w)
+    np.abs(w, out=w)
+    np.multiply(w, -0.48, out=w)
+    np.add(w, 0.62, out=w)
+    np.subtract(w, c, out=w)
+    return w
 
 
-def parzen(N, sym=True):
+@_cached_window
+def parzen(N, sym=True, out=None, dtype=np.float32):
     """
     Return a Parzen window.
 
@@ -75,20 +366,36 @@ def parzen(N, sym=True):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Parzen window of length N with given symmetry
 
     """
-    n = np.arange(N, dtype=float)
-    w = np.zeros(N, dtype=float)
-    n = 2 * n / (N-sym) - 1  # [0, N) -> [-1, 1]
-    w[abs(n) < 1/2 ] = 1 - 6 * n[abs(n) < 1/2]**2 + 6 * abs(n[abs(n) < 1/2])**3
-    w[abs(n) >= 1/2] = 2 * (1 - abs(n[abs(n) >= 1/2]))**3
+    w = _output(N, out, dtype)
+    kernel = _kernel('parzen', w)
+    if kernel is not None:
+        kernel(_denom(N, sym), w)
+        return w
+    n = np.divide(_ramp(N, w.dtype), _denom(N, sym) / 2)
+    np.subtract(n, 1, out=n)  # [0, N) -> [-1, 1]
+    an = np.abs(n)
+    # evaluate both polynomials over the whole window and select between them
+    # instead of gathering and scattering through boolean masks. The powers
+    # are explicit multiplies rather than calls to np.power.
+    n2 = n * n
+    one_minus = 1 - an
+    inner = 1 - 6 * n2 + 6 * n2 * an               # |n| < 1/2
+    outer = 2 * one_minus * one_minus * one_minus  # |n| >= 1/2
+    np.copyto(w, np.where(an < 1/2, inner, outer))
     return w
 
 
-def welch(N, sym=False):
+@_cached_window
+def welch(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Lanczos window.
 
@@ -98,16 +405,30 @@ def welch(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Lanczos window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    return 1 - ((n - (N - 1 - sym) / 2) / ((N + 1 - sym) / 2))**2
+    M = _denom(N, sym)
+    w = _output(N, out, dtype)
+    kernel = _kernel('welch', w)
+    if kernel is not None:
+        kernel((M - 1) / 2, (M + 1) / 2, w)
+        return w
+    np.subtract(_ramp(N, w.dtype), (M - 1) / 2, out=w)
+    np.divide(w, (M + 1) / 2, out=w)
+    np.square(w, out=w)
+    np.subtract(1, w, out=w)
+    return w
 
 
-def cosine(N, sym=False):
+@_cached_window
+def cosine(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Cosine window.
 
@@ -117,18 +438,31 @@ def cosine(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Cosine window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N + (not sym)
-#     return -np.cos(np.pi * (n + N/2 + 0.5) / N)
-    return np.sin(np.pi * (n + 0.5) / N)
+    # the samples are offset by a half, so the denominator is one longer
+    M = _denom(N, sym) + 1
+    w = _output(N, out, dtype)
+    kernel = _kernel('cosine', w)
+    if kernel is not None:
+        kernel(M, w)
+        return w
+    np.add(_ramp(N, w.dtype), 0.5, out=w)
+    np.multiply(w, _PI, out=w)
+    np.divide(w, M, out=w)
+    np.sin(w, out=w)
+    return w
 
 
-def bohman(N, sym=False):
+@_cached_window
+def bohman(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Bohman window.
 
@@ -138,17 +472,39 @@ def bohman(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Bohman window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = (N - 1 if sym else N) / 2
-    return (1 - abs(n / N - 1)) * np.cos(np.pi * abs(n / N - 1)) + (1.0 / np.pi) * np.sin(np.pi * abs(n / N - 1))
+    M = _denom(N, sym) / 2
+    w = _output(N, out, dtype)
+    kernel = _kernel('bohman', w)
+    if kernel is not None:
+        kernel(M, w)
+        return w
+    # u = |n / M - 1| is shared by all three terms
+    u = np.divide(_ramp(N, w.dtype), M)
+    np.subtract(u, 1, out=u)
+    np.abs(u, out=u)
+    np.subtract(1, u, out=w)
+    np.multiply(u, _PI, out=u)
+    # evaluate cos and sin of the same argument back to back so that libm can
+    # share the argument reduction between them
+    c = np.cos(u)
+    np.sin(u, out=u)
+    np.multiply(w, c, out=w)
+    np.multiply(u, _INV_PI, out=u)
+    np.add(w, u, out=w)
+    return w
 
 
-def lanczos(N, sym=False):
+@_cached_window
+def lanczos(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Lanczos window.
 
@@ -158,20 +514,29 @@ def lanczos(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Lanczos window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    w = np.pi * (2 * n / N - 1)
-    w = np.sin(w) / (w + 1e-12)
-    w[N//2] = 1
+    M = _denom(N, sym)
+    w = _output(N, out, dtype)
+    kernel = _kernel('lanczos', w)
+    if kernel is not None:
+        kernel(M, w)
+        return w
+    np.divide(_ramp(N, w.dtype), M / 2, out=w)
+    np.subtract(w, 1, out=w)
+    np.copyto(w, np.sinc(w))
     return w
 
 
-def hann(N, sym=True):
+@_cached_window
+def hann(N, sym=True, out=None, dtype=np.float32):
     """
     Return a Hann window.
 
@@ -181,17 +546,20 @@ def hann(N, sym=True):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Hann window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return 0.50 - 0.50 * np.cos(2 * np.pi * n / N)
+    return _cosine_sum(N, sym, (0.50, 0.50), out, dtype)
 
 
-def hamming(N, sym=False):
+@_cached_window
+def hamming(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Hamming window.
 
@@ -201,17 +569,20 @@ def hamming(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Hamming window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return 0.54 - 0.46 * np.cos(2 * np.pi * n / N)
+    return _cosine_sum(N, sym, (0.54, 0.46), out, dtype)
 
 
-def blackman(N, sym=False):
+@_cached_window
+def blackman(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Blackman window.
 
@@ -221,17 +592,20 @@ def blackman(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Blackman window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return 0.42 - 0.50 * np.cos(2 * np.pi * n / N) + 0.08 * np.cos(4 * np.pi * n / N)
+    return _cosine_sum(N, sym, (0.42, 0.50, 0.08), out, dtype)
 
 
-def blackmanharris(N, sym=False):
+@_cached_window
+def blackmanharris(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Blackman-Harris window.
 
@@ -241,21 +615,20 @@ def blackmanharris(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Blackman-Harris window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return (0.35875
-        - 0.48829 * np.cos(2 * np.pi * n / N)
-        + 0.14128 * np.cos(4 * np.pi * n / N)
-        - 0.01168 * np.cos(6 * np.pi * n / N)
-    )
+    return _cosine_sum(N, sym, (0.35875, 0.48829, 0.14128, 0.01168), out, dtype)
 
 
-def blackmannuttall(N, sym=False):
+@_cached_window
+def blackmannuttall(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Blackman-Harris window.
 
@@ -265,42 +638,44 @@ def blackmannuttall(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Blackman-Harris window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return (0.3635819
-        - 0.4891775 * np.cos(2 * np.pi * n / N)
-        + 0.1365995 * np.cos(4 * np.pi * n / N)
-        - 0.0106411 * np.cos(6 * np.pi * n / N)
-    )
+    coeffs = (0.3635819, 0.4891775, 0.1365995, 0.0106411)
+    return _cosine_sum(N, sym, coeffs, out, dtype)
 
 
-def kaiserbessel(N, sym=None):
+@_cached_window
+def kaiserbessel(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Kaiser window derived from a Bessel function.
 
     Args:
         N: Number of points in the output window. 
         If zero or less, an empty array is returned.
+        sym: When True, generates a symmetric window, for use in filter
+        design. When False (default), generates a periodic window, for use
+        in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Kaiser window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - sym
-    return (0.402
-        - 0.498 * np.cos(2 * np.pi * n / N)
-        + 0.098 * np.cos(4 * np.pi * n / N)
-        - 0.001 * np.cos(6 * np.pi * n / N)
-    )
+    return _cosine_sum(N, sym, (0.402, 0.498, 0.098, 0.001), out, dtype)
 
 
-def flattop(N, sym=False):
+@_cached_window
+def flattop(N, sym=False, out=None, dtype=np.float32):
     """
     Return a Flattop window.
 
@@ -310,19 +685,17 @@ def flattop(N, sym=False):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Flattop window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = N - 1 if sym else N
-    return (0.21557895
-        - 0.416631580 * np.cos(2 * np.pi * n / N)
-        + 0.277263158 * np.cos(4 * np.pi * n / N)
-        - 0.083578947 * np.cos(6 * np.pi * n / N)
-        + 0.006947368 * np.cos(8 * np.pi * n / N)
-    )
+    coeffs = (0.21557895, 0.416631580, 0.277263158, 0.083578947, 0.006947368)
+    return _cosine_sum(N, sym, coeffs, out, dtype)
 
 
 # ----------------------------------------------------------------------------
@@ -330,7 +703,8 @@ def flattop(N, sym=False):
 # ----------------------------------------------------------------------------
 
 
-def exponential(N, sym=False, alpha=1.0):
+@_cached_window
+def exponential(N, sym=False, alpha=1.0, out=None, dtype=np.float32):
     """
     Return a Exponential (Poission) window.
 
@@ -340,17 +714,31 @@ def exponential(N, sym=False, alpha=1.0):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Exponential (Poission) window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = (N - 1 if sym else N) / 2
-    return np.exp(-alpha * abs(n - N) / N)
+    M = _denom(N, sym) / 2
+    w = _output(N, out, dtype)
+    kernel = _kernel('exponential', w)
+    if kernel is not None:
+        kernel(M, alpha, w)
+        return w
+    np.subtract(_ramp(N, w.dtype), M, out=w)
+    np.abs(w, out=w)
+    np.divide(w, M, out=w)
+    np.multiply(w, -alpha, out=w)
+    np.exp(w, out=w)
+    return w
 
 
-def gaussian(N, sym=False, std=0.25):
+@_cached_window
+def gaussian(N, sym=False, std=0.25, out=None, dtype=np.float32):
     """
     Return a Lanczos window.
 
@@ -360,17 +748,31 @@ def gaussian(N, sym=False, std=0.25):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Lanczos window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = (N - 1 if sym else N) / 2
-    return np.exp(-0.5 * ((n - N)/(std * N))**2)
+    M = _denom(N, sym) / 2
+    w = _output(N, out, dtype)
+    kernel = _kernel('gaussian', w)
+    if kernel is not None:
+        kernel(M, std, w)
+        return w
+    np.subtract(_ramp(N, w.dtype), M, out=w)
+    np.divide(w, std * M, out=w)
+    np.square(w, out=w)
+    np.multiply(w, -0.5, out=w)
+    np.exp(w, out=w)
+    return w
 
 
-def hannpoisson(N, sym=False, alpha=1.0):
+@_cached_window
+def hannpoisson(N, sym=False, alpha=1.0, out=None, dtype=np.float32):
     """
     Return a Exponential (Poission) window.
 
@@ -380,17 +782,36 @@ def hannpoisson(N, sym=False, alpha=1.0):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Exponential (Poission) window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = (N - 1 if sym else N) / 2
-    return 0.5 * (1 - np.cos(np.pi * n / N)) * np.exp(-alpha * abs(n - N) / N)
+    M = _denom(N, sym) / 2
+    w = _output(N, out, dtype)
+    kernel = _kernel('hannpoisson', w)
+    if kernel is not None:
+        kernel(M, alpha, w)
+        return w
+    np.divide(_ramp(N, w.dtype), M, out=w)
+    e = np.subtract(w, 1)
+    np.abs(e, out=e)
+    np.multiply(e, -alpha, out=e)
+    np.exp(e, out=e)
+    np.multiply(w, _PI, out=w)
+    np.cos(w, out=w)
+    np.subtract(1, w, out=w)
+    np.multiply(w, 0.5, out=w)
+    np.multiply(w, e, out=w)
+    return w
 
 
-def tukey(N, sym=False, alpha=0.5):
+@_cached_window
+def tukey(N, sym=False, alpha=0.5, out=None, dtype=np.float32):
     """
     Return a Tukey window.
 
@@ -400,18 +821,137 @@ def tukey(N, sym=False, alpha=0.5):
         sym: When True (default), generates a symmetric window, 
         for use in filter design. When False, generates a 
         periodic window, for use in spectral analysis.
+        out: Optional array of length N to write the window into.
+        When None (default), a new array of the given dtype is allocated.
+        dtype: The floating point type of the allocated window, float32 by
+        default. Use float64 where precision matters, e.g., filter design.
 
     Returns:
         the Tukey window of length N with given symmetry
 
     """
-    n = np.arange(N)
-    N = (N - 1 if sym else N) / 2
-    w = 0.5 * (1 + np.cos(np.pi * (abs(n - N) - alpha * N)/((1 - alpha) * N)))
-    w[abs(n - N) < alpha * N] = 1
+    M = _denom(N, sym) / 2
+    d = _output(N, out, dtype)
+    if alpha >= 1:  # the flat top covers the whole window
+        d.fill(1.0)
+        return d
+    kernel = _kernel('tukey', d)
+    if kernel is not None:
+        kernel(M, alpha, d)
+        return d
+    np.subtract(_ramp(N, d.dtype), M, out=d)
+    np.abs(d, out=d)
+    # clamp the flat top to a phase of 0, where the raised cosine is 1
+    np.subtract(d, alpha * M, out=d)
+    np.maximum(d, 0, out=d)
+    np.divide(d, (1 - alpha) * M, out=d)
+    np.multiply(d, _PI, out=d)
+    np.cos(d, out=d)
+    np.add(d, 1, out=d)
+    np.multiply(d, 0.5, out=d)
+    return d
+
+
+# ----------------------------------------------------------------------------
+# MARK: Window Banks
+# ----------------------------------------------------------------------------
+
+
+def cosine_sum_batch(Ns, coeffs, sym=False, dtype=np.float32):
+    """
+    Return a bank of generalized cosine-sum windows of different lengths.
+
+    Args:
+        Ns: Number of points in each window of the bank. A scalar is
+        treated as a bank of one window.
+        coeffs: the magnitudes of the terms (a_0, a_1, ..., a_K) where the
+        sign of each term alternates starting from a positive a_0, e.g.,
+        (0.42, 0.50, 0.08) for a Blackman window.
+        sym: When True, generates symmetric windows, for use in filter
+        design. When False (default), generates periodic windows, for use
+        in spectral analysis.
+        dtype: The floating point type of the windows, float32 by default.
+        Use float64 where precision matters, e.g., filter design.
+
+    Returns:
+        an array of shape (len(Ns), max(Ns)) where row i holds the window of
+        length Ns[i] followed by zeros
+
+    """
+    Ns = np.atleast_1d(np.asarray(Ns, dtype=int))
+    n = _ramp(Ns.max(initial=0), np.dtype(dtype))
+    denom = _denom(Ns, sym)
+    # broadcast the ramp against the denominator of each window to compute
+    # the phases of the entire bank in one pass. The integer denominators are
+    # cast first so that float32 banks are not promoted to float64.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = np.divide(n, denom.astype(dtype)[:, None])
+        w = _cosine_series(x, coeffs, np.empty(x.shape, dtype=dtype))
+    # a zero denominator divides by zero. The row is either empty or holds
+    # the one-point window [1] like the single window functions
+    w[denom == 0, :1] = 1.0
+    # zero the padding past the end of each window
+    np.copyto(w, 0.0, where=n >= Ns[:, None])
     return w
 
 
+# ----------------------------------------------------------------------------
+# MARK: Window Application
+# ----------------------------------------------------------------------------
+
+
+# A sentinel that stands in for a Boxcar window of any length.
+BOXCAR = np.ones(0, dtype=np.float32)
+BOXCAR.flags.writeable = False
+
+
+def is_trivial(window):
+    """
+    Return whether applying the given window leaves a signal unchanged.
+
+    Args:
+        window: the window to check
+
+    Returns:
+        True if the window is None, BOXCAR, or a window of ones from boxcar,
+        False otherwise
+
+    """
+    if window is None or window is BOXCAR:
+        return True
+    # boxcar broadcasts a single one with a stride of 0, so the first sample
+    # determines the whole window without reading the rest of it
+    return (
+        window.ndim == 1 and window.size > 0 and window[0] == 1
+        and (window.strides[0] == 0 or window.size == 1)
+    )
+
+
+def apply_window(block, window, out=None):
+    """
+    Apply a window to a block of samples.
+
+    Args:
+        block: the block of samples to apply the window to
+        window: the window of the same length as the block, or None / BOXCAR
+        for a rectangular window
+        out: Optional array to write the windowed block into, which may be
+        the block itself to window it in place. When None (default), a new
+        array is allocated unless the window is trivial.
+
+    Returns:
+        the windowed block, which is the block itself when the window is
+        trivial and no out array is provided
+
+    """
+    if is_trivial(window):
+        if out is None or out is block:
+            return block
+        np.copyto(out, block)
+        return out
+    return np.multiply(block, window, out=out)
+
+
 # Explicitly define the outward facing API of this module.
 __all__ = [
     boxcar.__name__,
@@ -433,4 +973,8 @@ __all__ = [
     gaussian.__name__,
     hannpoisson.__name__,
     tukey.__name__,
+    cosine_sum_batch.__name__,
+    'BOXCAR',
+    is_trivial.__name__,
+    apply_window.__name__,
 ]
@@ -0,0 +1,27 @@
+"""
+Ahead-of-time compile the kernels in window_numba.py.
+
+Run `python window_aot.py` to build the window_native extension module next to
+this file. window.py imports window_native when it is present, which avoids
+both importing Numba and the JIT compilation on first use.
+"""
+import os
+from numba.pycc import CC
+import window_numba
+
+
+cc = CC('window_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+for name in window_numba.__all__:
+    kernel = getattr(window_numba, name)
+    # pycc exports one signature per name, so each signature of the kernel is
+    # exported with the dtype of its output array as a suffix, e.g.,
+    # cosine_sum_float32. The data layout is fixed at build time.
+    for dtype, signature in window_numba.SIGNATURES[name].items():
+        exported = '%s_%s' % (name, dtype)
+        # export the pure Python kernel, pycc compiles prange as a serial range
+        cc.export(exported, signature)(kernel.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,107 @@
+"""CuPy implementations of the cosine-sum windows in window.py."""
+try:  # CuPy is optional, the host implementations are used without it
+    import cupy as cp
+except ImportError:
+    cp = None
+
+
+if cp is None:
+    from window import hann
+    from window import hamming
+    from window import blackman
+    from window import blackmanharris
+    from window import blackmannuttall
+    from window import kaiserbessel
+    from window import flattop
+else:
+    # A single kernel evaluates every cosine-sum window with up to five terms
+    # directly into device memory, unused terms have a coefficient of zero.
+    # The window is computed in double precision and stored in the dtype T of
+    # the output array.
+    _cosine_sum_kernel = cp.ElementwiseKernel(
+        'float64 M, float64 a0, float64 a1, float64 a2, float64 a3, float64 a4',
+        'T w',
+        '''
+        // cos(k phi) follows from the Chebyshev recurrence on cos(phi)
+        double c1 = cos(2 * M_PI * i / M);
+        double c2 = 2 * c1 * c1 - 1;
+        double c3 = 2 * c1 * c2 - c1;
+        double c4 = 2 * c1 * c3 - c2;
+        w = a0 - a1 * c1 + a2 * c2 - a3 * c3 + a4 * c4;
+        ''',
+        'cosine_sum_kernel'
+    )
+
+    def _cosine_sum(N, sym, coeffs, out=None, dtype=cp.float32):
+        """
+        Return a generalized cosine-sum window in device memory.
+
+        Args:
+            N: Number of points in the output window.
+            sym: whether to generate a symmetric or periodic window
+            coeffs: the magnitudes of the terms (a_0, a_1, ..., a_K) where the
+            sign of each term alternates starting from a positive a_0
+            out: optional device array of length N to write the window into
+            dtype: the floating point type of the window when allocating it
+
+        Returns:
+            the window sum_k (-1)^k a_k cos(2 pi k n / N) of length N
+
+        Raises:
+            ValueError: if out is provided and its shape is not (N,)
+
+        """
+        shape = (max(N, 0),)
+        if out is None:
+            out = cp.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError('out has shape %s, expected %s' % (out.shape, shape))
+        M = N - 1 if sym else N
+        if M == 0:  # a single point has no phase, see window._cached_window
+            out.fill(1.0)
+            return out
+        coeffs = tuple(coeffs) + (0.0,) * (5 - len(coeffs))
+        return _cosine_sum_kernel(float(M), *coeffs, out)
+
+    def hann(N, sym=True, out=None, dtype=cp.float32):
+        """Return a Hann window in device memory, see window.hann."""
+        return _cosine_sum(N, sym, (0.50, 0.50), out, dtype)
+
+    def hamming(N, sym=False, out=None, dtype=cp.float32):
+        """Return a Hamming window in device memory, see window.hamming."""
+        return _cosine_sum(N, sym, (0.54, 0.46), out, dtype)
+
+    def blackman(N, sym=False, out=None, dtype=cp.float32):
+        """Return a Blackman window in device memory, see window.blackman."""
+        return _cosine_sum(N, sym, (0.42, 0.50, 0.08), out, dtype)
+
+    def blackmanharris(N, sym=False, out=None, dtype=cp.float32):
+        """Return a Blackman-Harris window in device memory."""
+        coeffs = (0.35875, 0.48829, 0.14128, 0.01168)
+        return _cosine_sum(N, sym, coeffs, out, dtype)
+
+    def blackmannuttall(N, sym=False, out=None, dtype=cp.float32):
+        """Return a Blackman-Nuttall window in device memory."""
+        coeffs = (0.3635819, 0.4891775, 0.1365995, 0.0106411)
+        return _cosine_sum(N, sym, coeffs, out, dtype)
+
+    def kaiserbessel(N, sym=False, out=None, dtype=cp.float32):
+        """Return a Kaiser-Bessel window in device memory."""
+        return _cosine_sum(N, sym, (0.402, 0.498, 0.098, 0.001), out, dtype)
+
+    def flattop(N, sym=False, out=None, dtype=cp.float32):
+        """Return a Flattop window in device memory, see window.flattop."""
+        coeffs = (0.21557895, 0.416631580, 0.277263158, 0.083578947, 0.006947368)
+        return _cosine_sum(N, sym, coeffs, out, dtype)
+
+
+# Explicitly define the outward facing API of this module.
+__all__ = [
+    hann.__name__,
+    hamming.__name__,
+    blackman.__name__,
+    blackmanharris.__name__,
+    blackmannuttall.__name__,
+    kaiserbessel.__name__,
+    flattop.__name__,
+]
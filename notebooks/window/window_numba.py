@@ -0,0 +1,187 @@
+"""Numba kernels for the window functions in window.py."""
+import math
+from numba import njit, prange
+
+
+# Numba freezes module globals into the kernels as compile-time constants.
+_INV_PI = 1 / math.pi
+
+
+# The explicit signatures of each kernel keyed by the dtype of its output
+# array. The JIT does not use them, window_aot.py exports them ahead of time.
+SIGNATURES = {}
+
+
+def kernel(*scalars, outputs=('float32', 'float64')):
+    """
+    Return a decorator that JIT compiles a kernel on its first call.
+
+    Kernels are compiled lazily for the types they are called with and cached
+    on disk, so importing this module compiles nothing. The NumPy error model
+    makes degenerate lengths produce NaN / inf like the NumPy implementations
+    instead of raising ZeroDivisionError.
+
+    Args:
+        scalars: the Numba types of the arguments before the output array
+        outputs: the dtypes of the output arrays that window.py uses the
+        kernel for
+
+    Returns:
+        a decorator that JIT compiles a kernel and records its signature for
+        each of the output dtypes in SIGNATURES
+
+    """
+    arrays = {'float32': 'f4[:]', 'float64': 'f8[:]'}
+    options = dict(cache=True, parallel=True, fastmath=True, error_model='numpy')
+
+    def decorator(function):
+        SIGNATURES[function.__name__] = {
+            dtype: 'void(%s)' % ', '.join(scalars + (arrays[dtype],))
+            for dtype in outputs
+        }
+        return njit(**options)(function)
+
+    return decorator
+
+
+# The kernel evaluates a scalar double precision cos per sample. That beats
+# the multiple passes of the NumPy series for float64 windows, but NumPy's
+# vectorized single precision cos is faster for float32 ones.
+@kernel('f8', 'f8[:]', outputs=('float64',))
+def cosine_sum(M, coeffs, out):
+    """
+    Compute a generalized cosine-sum window of five terms in a single pass.
+
+    Args:
+        M: the denominator of the phase 2 pi n / M
+        coeffs: the magnitudes of the five terms (a_0, a_1, ..., a_4) where
+        the sign of each term alternates starting from a positive a_0, unused
+        terms have a coefficient of zero
+        out: the array to write the window into
+
+    Returns:
+        None
+
+    """
+    a0, a1, a2, a3, a4 = coeffs[0], coeffs[1], coeffs[2], coeffs[3], coeffs[4]
+    for i in prange(out.size):
+        # cos(k phi) follows from the Chebyshev recurrence on cos(phi)
+        c1 = math.cos(2 * math.pi * i / M)
+        c2 = 2 * c1 * c1 - 1
+        c3 = 2 * c1 * c2 - c1
+        c4 = 2 * c1 * c3 - c2
+        out[i] = a0 - a1 * c1 + a2 * c2 - a3 * c3 + a4 * c4
+
+
+@kernel('f8')
+def bartlett(M, out):
+    """Compute a Bartlett window with denominator M into out."""
+    for i in prange(out.size):
+        out[i] = 1 - abs(2 * i / M - 1)
+
+
+@kernel('f8')
+def barthann(M, out):
+    """Compute a Bartlett-Hann window with denominator M into out."""
+    for i in prange(out.size):
+        x = i / M
+        out[i] = 0.62 - 0.48 * abs(x - 0.5) - 0.38 * math.cos(2 * math.pi * x)
+
+
+@kernel('f8')
+def parzen(M, out):
+    """Compute a Parzen window with denominator M into out."""
+    for i in prange(out.size):
+        n = 2 * i / M - 1
+        an = abs(n)
+        if an < 0.5:
+            out[i] = 1 - 6 * n * n + 6 * an * an * an
+        else:
+            out[i] = 2 * (1 - an) * (1 - an) * (1 - an)
+
+
+@kernel('f8', 'f8')
+def welch(center, half_width, out):
+    """Compute a Welch window about center with given half-width into out."""
+    for i in prange(out.size):
+        x = (i - center) / half_width
+        out[i] = 1 - x * x
+
+
+@kernel('f8')
+def cosine(M, out):
+    """Compute a Cosine window with denominator M into out."""
+    for i in prange(out.size):
+        out[i] = math.sin(math.pi * (i + 0.5) / M)
+
+
+@kernel('f8')
+def bohman(M, out):
+    """Compute a Bohman window with half-length M into out."""
+    for i in prange(out.size):
+        u = abs(i / M - 1)
+        a = math.pi * u
+        # adjacent sin / cos of one argument are fused into a single sincos
+        s = math.sin(a)
+        c = math.cos(a)
+        out[i] = (1 - u) * c + _INV_PI * s
+
+
+@kernel('f8')
+def lanczos(M, out):
+    """Compute a Lanczos window with denominator M into out."""
+    for i in prange(out.size):
+        x = math.pi * (2 * i / M - 1)
+        out[i] = 1.0 if x == 0 else math.sin(x) / x
+
+
+@kernel('f8', 'f8')
+def exponential(M, alpha, out):
+    """Compute an Exponential window with half-length M into out."""
+    for i in prange(out.size):
+        out[i] = math.exp(-alpha * abs(i - M) / M)
+
+
+@kernel('f8', 'f8')
+def gaussian(M, std, out):
+    """Compute a Gaussian window with half-length M into out."""
+    for i in prange(out.size):
+        x = (i - M) / (std * M)
+        out[i] = math.exp(-0.5 * x * x)
+
+
+@kernel('f8', 'f8')
+def hannpoisson(M, alpha, out):
+    """Compute a Hann-Poisson window with half-length M into out."""
+    for i in prange(out.size):
+        x = i / M
+        out[i] = 0.5 * (1 - math.cos(math.pi * x)) * math.exp(-alpha * abs(x - 1))
+
+
+@kernel('f8', 'f8')
+def tukey(M, alpha, out):
+    """Compute a Tukey window with half-length M into out."""
+    if alpha >= 1:  # the flat top covers the whole window
+        out[:] = 1.0
+        return
+    for i in prange(out.size):
+        # the flat top clamps to a phase of 0, where the raised cosine is 1
+        d = max(abs(i - M) - alpha * M, 0.0)
+        out[i] = 0.5 * (1 + math.cos(math.pi * d / ((1 - alpha) * M)))
+
+
+# Explicitly define the outward facing API of this module.
+__all__ = [
+    cosine_sum.__name__,
+    bartlett.__name__,
+    barthann.__name__,
+    parzen.__name__,
+    welch.__name__,
+    cosine.__name__,
+    bohman.__name__,
+    lanczos.__name__,
+    exponential.__name__,
+    gaussian.__name__,
+    hannpoisson.__name__,
+    tukey.__name__,
+]
@@ -3,6 +3,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
+# Ticks of the phase response from -2 pi to 2 pi in steps of pi / 4.
+_PHASE_TICKS = np.pi * np.linspace(-2.0, 2.0, 17)
+
+
 def zplot(w, h):
     """
     Plot data from scipy.signal.freqz.
@@ -16,38 +20,27 @@ def zplot(w, h):
 
     """
     fig, axs = plt.subplots(1, 2, sharex=True, figsize=(12, 5))
+    frequency = w * (1 / np.pi)
     # magnitude response
-    axs[0].plot(w / np.pi, 20 * np.log10(np.abs(h) + 1e-7))
-    axs[0].set_xlabel('Normalized Angular Frequency')
-    axs[0].set_xlim([0, 1])
-    axs[0].set_ylabel('Magnitude Response (dB)')
-#     axs[0].set_ylim([-60, 30])
+    magnitude = np.abs(h)
+    magnitude += 1e-7
+    np.log10(magnitude, out=magnitude)
+    magnitude *= 20
+    axs[0].plot(frequency, magnitude)
+    axs[0].set(
+        xlabel='Normalized Angular Frequency',
+        xlim=[0, 1],
+        ylabel='Magnitude Response (dB)',
+    )
     axs[0].grid()
     # phase response
-    YTICKS = np.array([-2.0, -1.75, -1.5, -1.25, -1.0, -0.75, -0.5, -0.25, 0.0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0])
-#     # - normalized frequency
-#     axs[1].plot(w / np.pi, np.unwrap(np.angle(h)) / np.pi)
-#     axs[1].set_xlabel('Normalized Angular Frequency')
-#     axs[1].set_xlim([0, 1])
-#     axs[1].set_ylabel('Phase Response (Normalized Angular Frequency)')
-#     axs[1].set_ylim([-2, 2])
-#     axs[1].set_yticks(YTICKS)
-#     axs[1].grid()
-#     # - degrees
-#     axs[1].plot(w / np.pi, np.unwrap(np.angle(h)) * 180 / np.pi)
-#     axs[1].set_xlabel('Normalized Frequency')
-#     axs[0].set_xlim([0, 1])
-#     axs[1].set_ylabel('Phase Response (Degrees)')
-#     axs[1].set_ylim([-360, 360])
-#     axs[1].set_yticks(180 * YTICKS)
-#     axs[1].grid()
-    # - radians
-    axs[1].plot(w / np.pi, np.unwrap(np.angle(h)))
-    axs[1].set_xlabel('Normalized Frequency')
-    axs[0].set_xlim([0, 1])
-    axs[1].set_ylabel('Phase Response (radians)')
-    axs[1].set_ylim([-np.pi, np.pi])
-    axs[1].set_yticks(np.pi * YTICKS)
+    axs[1].plot(frequency, np.unwrap(np.angle(h)))
+    axs[1].set(
+        xlabel='Normalized Frequency',
+        ylabel='Phase Response (radians)',
+        ylim=[-np.pi, np.pi],
+        yticks=_PHASE_TICKS,
+    )
     axs[1].grid()
 
 